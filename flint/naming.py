@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal, NamedTuple, overload
 
@@ -471,6 +472,7 @@ class ProcessedNameComponents(NamedTuple):
     """The channel range encoded in an file name. Generally are zero-padded, and are two fields of the form ch1234-1235, where the upper bound is exclusive. Defaults to none."""
 
 
+@lru_cache(maxsize=512)
 def processed_ms_format(
     in_name: str | Path,
 ) -> ProcessedNameComponents | None:
@@ -864,6 +866,7 @@ def create_linmos_base_path(
     return output_name.absolute()
 
 
+@lru_cache(maxsize=512)
 def get_sbid_from_path(path: Path) -> int:
     """Attempt to extract the SBID of a observation from a path. It is a fairly simple ruleset
     that follows the typical use cases that are actually in practise. There is no mechanism to
@@ -2,16 +2,129 @@
 
 from __future__ import annotations
 
+import logging
+import os
+from contextlib import closing
 from pathlib import Path
+from queue import Empty, Full, Queue
 from subprocess import CalledProcessError
-from time import sleep
-from typing import Callable, Collection
+from threading import Event, Thread
+from time import monotonic, sleep
+from typing import Any, Callable, Collection, Iterable, Iterator
 
 from spython.main import Client as sclient
 
 from flint.exceptions import AttemptRerunException
 from flint.logging import logger
-from flint.utils import get_job_info, log_job_environment
+from flint.utils import get_environment_variable, get_job_info, log_job_environment
+
+LOG_BUFFER_SIZE = 4096
+"""Approximate number of characters of container output to accumulate before emitting a log record"""
+LOG_FLUSH_INTERVAL = 1.0
+"""Maximum number of seconds container output is held before it is logged"""
+OUTPUT_QUEUE_SIZE = 1024
+"""Maximum number of lines of container output held while waiting to be processed"""
+
+_END_OF_OUTPUT = object()
+
+
+def _bind_path(path: Path, resolve: bool = False) -> str:
+    """Form the path of a directory to bind into a container. Relative
+    paths are made absolute, and symbolic links are only resolved when
+    requested.
+
+    Args:
+        path (Path): The directory to bind
+        resolve (bool, optional): Resolve any symbolic links in ``path``. Defaults to False.
+
+    Returns:
+        str: The absolute path to bind
+    """
+    path = Path(path)
+    if resolve:
+        return path.absolute().resolve().as_posix()
+
+    return os.fspath(path if path.is_absolute() else path.absolute())
+
+
+def _drain_output(output: Iterable[str], line_queue: Queue, stop_event: Event) -> None:
+    """Consume lines from ``output`` and place them onto ``line_queue``. Once
+    ``output`` is exhausted a marker is placed on the queue. Should ``output``
+    raise an exception (including ``SystemExit`` and the like) it is placed
+    on the queue instead, so the consumer is never left waiting.
+
+    Args:
+        output (Iterable[str]): The output lines to drain
+        line_queue (Queue): Where lines are placed
+        stop_event (Event): Signals that the consumer has stopped and draining should cease
+    """
+
+    def _put(item: Any) -> bool:
+        while not stop_event.is_set():
+            try:
+                line_queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    item: Any = _END_OF_OUTPUT
+    try:
+        for line in output:
+            if not _put(line):
+                item = None
+                break
+    except BaseException as e:
+        item = e
+    finally:
+        try:
+            close = getattr(output, "close", None)
+            if close:
+                close()
+        finally:
+            if item is not None:
+                _put(item)
+
+
+def _iterate_output(
+    output: Iterable[str],
+    idle_func: Callable[[], None] | None = None,
+    idle_interval: float = LOG_FLUSH_INTERVAL,
+) -> Iterator[str]:
+    """Iterate over the lines of ``output`` while they are read in a separate
+    thread. This keeps the pipe of the underlying process drained while
+    the lines are being processed. Exceptions raised while reading ``output``
+    are raised here.
+
+    Args:
+        output (Iterable[str]): The output lines to iterate over
+        idle_func (Callable[[], None] | None, optional): Called whenever no new line has arrived within ``idle_interval`` seconds. Defaults to None.
+        idle_interval (float, optional): Seconds to wait for a new line before calling ``idle_func``. Defaults to LOG_FLUSH_INTERVAL.
+
+    Yields:
+        Iterator[str]: Lines from ``output``
+    """
+    line_queue: Queue = Queue(maxsize=OUTPUT_QUEUE_SIZE)
+    stop_event = Event()
+    reader = Thread(
+        target=_drain_output, args=(output, line_queue, stop_event), daemon=True
+    )
+    reader.start()
+
+    try:
+        while True:
+            try:
+                item = line_queue.get(timeout=idle_interval if idle_func else None)
+            except Empty:
+                idle_func()  # type: ignore[misc]
+                continue
+            if item is _END_OF_OUTPUT:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop_event.set()
 
 
 def pull_container(container_directory: Path, uri: str, file_name: str) -> Path:
@@ -55,7 +168,7 @@ def run_singularity_command(
     Args:
         image (Path): The singularity container image to use
         command (str): The command to execute
-        bind_dirs (Optional[Union[Path,Collection[Path]]], optional): Specifies a Path, or list of Paths, to bind to in the container. Defaults to None.
+        bind_dirs (Optional[Union[Path,Collection[Path]]], optional): Specifies a Path, or list of Paths, to bind to in the container. Symbolic links are resolved only if the ``FLINT_RESOLVE_BINDS`` environment variable is set to ``1``. Defaults to None.
         stream_callback_func (Optional[Callable], optional): Provide a function that is applied to each line of output text when singularity is running and `stream=True`. IF provide it should accept a single (string) parameter. If None, nothing happens. Defaultds to None.
         ignore_logging_output (bool, optional): If `True` output from the executed singularity command is not logged. Defaults to False.
         max_reties (int, optional): If a callback handler is specified which raised an `AttemptRerunException`, this signifies how many attempts should be made. Defaults to 2.
@@ -67,7 +180,10 @@ def run_singularity_command(
     if max_retries <= 0:
         raise ValueError("Too many retries")
 
-    if not image.exists():
+    # Not cached, as the container could be removed or re-pointed between calls
+    try:
+        resolved_image = Path(image).resolve(strict=True).as_posix()
+    except FileNotFoundError:
         raise FileNotFoundError(f"The singularity container {image} was not found. ")
 
     logger.info(f"Running {command} in {image}")
@@ -79,19 +195,19 @@ def run_singularity_command(
         if isinstance(bind_dirs, Path):
             bind_dirs = [bind_dirs]
 
+        # Symbolic links are only resolved when FLINT_RESOLVE_BINDS=1
+        resolve = get_environment_variable(variable="FLINT_RESOLVE_BINDS") == "1"
         # Get only unique paths to avoid duplication in bindstring.
-        # bind_str = ",".join(set([str(p.absolute().resolve()) for p in bind_dirs]))
-        bind = (
-            list(set([str(Path(p).absolute().resolve()) for p in bind_dirs]))
-            if len(bind_dirs) > 0
-            else None
-        )
+        bind = sorted({_bind_path(path=p, resolve=resolve) for p in bind_dirs}) or None
 
         logger.info(f"Constructed singularity bindings: {bind}")
 
     try:
+        # spython spawns the process with the default ``bufsize=-1``, so the
+        # pipe is already read through a buffered text wrapper. There is no
+        # need to shim ``subprocess.Popen`` here.
         output = sclient.execute(
-            image=image.resolve(strict=True).as_posix(),
+            image=resolved_image,
             command=command.split(),
             bind=bind,
             return_result=True,
@@ -100,11 +216,41 @@ def run_singularity_command(
             stream_type="both",
         )
 
-        for line in output:
-            if not ignore_logging_output:
-                logger.info(line.rstrip())
-            if stream_callback_func:
-                stream_callback_func(line)
+        # Lines are batched into larger log records to avoid the overhead
+        # of constructing and emitting a record for every line of chatty tools.
+        # Batches are also emitted once LOG_FLUSH_INTERVAL seconds have passed,
+        # so progress is not held back from slow running commands.
+        log_output = not ignore_logging_output and logger.isEnabledFor(logging.INFO)
+        callback = stream_callback_func
+        buffer: list[str] = []
+        buffer_size = 0
+        last_flush = monotonic()
+
+        def _flush_buffer() -> None:
+            nonlocal buffer_size, last_flush
+            if buffer:
+                logger.info("".join(buffer).rstrip())
+                buffer.clear()
+            buffer_size = 0
+            last_flush = monotonic()
+
+        with closing(
+            _iterate_output(output, idle_func=_flush_buffer if log_output else None)
+        ) as lines:
+            try:
+                for line in lines:
+                    if log_output:
+                        buffer.append(line)
+                        buffer_size += len(line)
+                        if (
+                            buffer_size >= LOG_BUFFER_SIZE
+                            or monotonic() - last_flush >= LOG_FLUSH_INTERVAL
+                        ):
+                            _flush_buffer()
+                    if callback:
+                        callback(line)
+            finally:
+                _flush_buffer()
 
         # Sleep for a few moments. If the command created files (often they do), give the lustre a moment
         # to properly register them. You dirty sea dog.
@@ -4,10 +4,13 @@ from __future__ import (  # Used for mypy/pylance to like the return type of MS.
     annotations,
 )
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import NamedTuple
 
 import astropy.units as u
+import numpy as np
 from astropy.coordinates import (
     AltAz,
     EarthLocation,
@@ -16,6 +19,7 @@ from astropy.coordinates import (
     SkyCoord,
     concatenate,
 )
+from astropy.io import fits
 from astropy.table import Table
 from astropy.time import Time
 
@@ -91,10 +95,7 @@ class FieldSummary(NamedTuple):
     """The orientation of the ASKAP third-axis in radians. """
 
     def with_options(self, **kwargs) -> FieldSummary:
-        prop = self._asdict()
-        prop.update(**kwargs)
-
-        return FieldSummary(**prop)
+        return self._replace(**kwargs) if kwargs else self
 
 
 def _get_pol_axis_as_rad(ms: MS | Path) -> float:
@@ -117,6 +118,40 @@ def _get_pol_axis_as_rad(ms: MS | Path) -> float:
     return pol_axis.to(u.rad).value
 
 
+def _transform_to_altaz(
+    centre: SkyCoord, ms_times: Time, location: EarthLocation
+) -> SkyCoord:
+    """Transform a position into the AltAz frame across a set of times. The
+    transform is only carried out on the unique times, and the result expanded
+    back to the shape of ``ms_times``.
+
+    Args:
+        centre (SkyCoord): The position to transform
+        ms_times (Time): Times to compute the AltAz coordinates at
+        location (EarthLocation): Location of the telescope
+
+    Returns:
+        SkyCoord: The position in the AltAz frame at each of the ``ms_times``
+    """
+    # A FieldSummary only holds the start and end times, for which there
+    # is nothing to gain from finding the unique times
+    if ms_times.isscalar or ms_times.size <= 2:
+        return centre.transform_to(AltAz(obstime=ms_times, location=location))
+
+    # Use both parts of the two-part JD to avoid losing precision
+    flat_times = ms_times.ravel()
+    jds = np.stack([flat_times.jd1, flat_times.jd2], axis=-1)
+    _, index, inverse = np.unique(jds, axis=0, return_index=True, return_inverse=True)
+    if len(index) == len(flat_times):
+        return centre.transform_to(AltAz(obstime=ms_times, location=location))
+
+    # Indexing keeps the attributes (location, format, precision) of ms_times
+    unique_times = flat_times[index]
+    centre_altaz = centre.transform_to(AltAz(obstime=unique_times, location=location))
+
+    return centre_altaz[inverse.reshape(-1)].reshape(ms_times.shape)
+
+
 # TODO: Need to establise a MSLike type
 def add_ms_summaries(field_summary: FieldSummary, mss: list[MS]) -> FieldSummary:
     """Obtain a MSSummary instance to add to a FieldSummary
@@ -148,7 +183,9 @@ def add_ms_summaries(field_summary: FieldSummary, mss: list[MS]) -> FieldSummary
 
     telescope = field_summary.location
     ms_times = field_summary.ms_times
-    centre_altaz = centre.transform_to(AltAz(obstime=ms_times, location=telescope))
+    centre_altaz = _transform_to_altaz(
+        centre=centre, ms_times=ms_times, location=telescope
+    )
     hour_angles = centre_altaz.az.to(u.hourangle)  # type: ignore
     elevations = centre_altaz.alt.to(u.deg)  # type: ignore
 
@@ -167,6 +204,27 @@ def add_ms_summaries(field_summary: FieldSummary, mss: list[MS]) -> FieldSummary
     return field_summary
 
 
+@lru_cache(maxsize=32)
+def _get_no_components(catalogue_path: Path, modified_time: float) -> int:
+    """Count the number of components in a source catalogue. For FITS
+    tables only the header of the table extension is read.
+
+    Results are cached, so ``modified_time`` is included to invalidate
+    a previous result should the catalogue be regenerated.
+
+    Args:
+        catalogue_path (Path): Path to the component catalogue
+        modified_time (float): The modification time of ``catalogue_path``
+
+    Returns:
+        int: The number of rows in the catalogue
+    """
+    if Path(catalogue_path).suffix.lower() == ".fits":
+        return int(fits.getval(catalogue_path, "NAXIS2", ext=1))
+
+    return len(Table.read(catalogue_path))
+
+
 def add_rms_information(
     field_summary: FieldSummary, aegean_outputs: AegeanOutputs
 ) -> FieldSummary:
@@ -190,7 +248,10 @@ def add_rms_information(
     Returns:
         FieldSummary: Updated field summary object
     """
-    no_components = len(Table.read(aegean_outputs.comp))
+    no_components = _get_no_components(
+        catalogue_path=Path(aegean_outputs.comp),
+        modified_time=os.path.getmtime(aegean_outputs.comp),
+    )
 
     field_summary = field_summary.with_options(
         no_components=no_components,
@@ -309,7 +370,8 @@ def create_field_summary(
         logger.info(f"Extracting SBID from {cal_sbid_path=} failed. Using {cal_sbid=}")
 
     ms_times = get_times_from_ms(ms=ms)
-    integration = ms_times.ptp().to(u.second).value
+    start_time, end_time = ms_times.min(), ms_times.max()
+    integration = (end_time - start_time).to(u.second).value
     location = get_telescope_location_from_ms(ms=ms)
 
     pol_axis = _get_pol_axis_as_rad(ms=ms)
@@ -321,7 +383,7 @@ def create_field_summary(
         location=location,
         integration_time=integration,
         holography_path=holography_path,
-        ms_times=Time([ms_times.min(), ms_times.max()]),
+        ms_times=Time([start_time, end_time]),
         pol_axis=pol_axis,
         **kwargs,
     )
@@ -10,6 +10,7 @@ import shutil
 import signal
 import subprocess
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from socket import gethostname
 from typing import Any, Generator, NamedTuple
@@ -547,7 +548,21 @@ def estimate_skycoord_centre(
     return mean_position
 
 
-def estimate_image_centre(image_path: Path) -> SkyCoord:
+@lru_cache(maxsize=32)
+def _estimate_image_centre(image_path: Path, modified_time: float) -> SkyCoord:
+    """Cached worker for ``estimate_image_centre``. The ``modified_time``
+    of the image is part of the cache key so a regenerated image is re-read.
+
+    The returned ``SkyCoord`` is shared between calls and should not be
+    modified. ``estimate_image_centre`` returns a copy of it.
+
+    Args:
+        image_path (Path): The FITS image to inspect
+        modified_time (float): The modification time of ``image_path``
+
+    Returns:
+        SkyCoord: The position of the centre pixel
+    """
     with fits.open(image_path, memmap=True) as open_image:
         image_header = open_image[0].header
         image_shape = open_image[0].data.shape
@@ -561,6 +576,25 @@ def estimate_image_centre(image_path: Path) -> SkyCoord:
     return centre_sky
 
 
+def estimate_image_centre(image_path: Path) -> SkyCoord:
+    """Estimate the sky position of the centre pixel of a FITS image.
+    Results are cached against the path and modification time of the image.
+
+    Args:
+        image_path (Path): The FITS image to inspect
+
+    Returns:
+        SkyCoord: The position of the centre pixel
+    """
+    image_path = Path(image_path)
+
+    centre_sky = _estimate_image_centre(
+        image_path=image_path, modified_time=image_path.stat().st_mtime
+    )
+
+    return centre_sky.copy()
+
+
 def zip_folder(
     in_path: Path, out_zip: Path | None = None, archive_format: str = "tar"
 ) -> Path:
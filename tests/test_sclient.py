@@ -0,0 +1,222 @@
+"""Tests around the helpers used when running singularity commands"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import time
+from contextlib import closing
+from pathlib import Path
+from subprocess import CalledProcessError
+from threading import Thread
+
+import pytest
+
+import flint.sclient
+from flint.sclient import _bind_path, _iterate_output, run_singularity_command
+
+
+@pytest.fixture
+def fake_container(tmpdir, monkeypatch):
+    """A container image file with ``sclient.execute`` replaced by one that
+    records its calls and yields the lines set in ``output``"""
+    image = Path(tmpdir) / "example.sif"
+    image.touch()
+
+    calls: list[dict] = []
+    output: list[str] = ["line\n"]
+
+    def _execute(**kwargs):
+        calls.append(kwargs)
+        return iter(list(output))
+
+    monkeypatch.setattr(flint.sclient.sclient, "execute", _execute)
+    monkeypatch.setattr(flint.sclient, "sleep", lambda _: None)
+
+    return image, calls, output
+
+
+def test_iterate_output_preserves_lines():
+    """All lines should come through in order, more than fit into the queue"""
+    lines = [f"line {i}\n" for i in range(5000)]
+
+    assert list(_iterate_output(iter(lines))) == lines
+
+
+def test_iterate_output_raises_reader_error():
+    """Errors raised while reading, like a failed command, should be
+    raised to the consumer after the lines before it"""
+
+    def _output():
+        yield "first\n"
+        raise CalledProcessError(returncode=1, cmd="example")
+
+    seen = []
+    with pytest.raises(CalledProcessError):
+        for line in _iterate_output(_output()):
+            seen.append(line)
+
+    assert seen == ["first\n"]
+
+
+def test_iterate_output_raises_reader_base_exception():
+    """A BaseException from the reader, like SystemExit, should be raised
+    to the consumer rather than leaving it waiting forever"""
+
+    def _output():
+        yield "first\n"
+        sys.exit(1)
+
+    seen: list[str] = []
+    raised: list[BaseException] = []
+
+    def _consume():
+        try:
+            for line in _iterate_output(_output()):
+                seen.append(line)
+        except BaseException as e:
+            raised.append(e)
+
+    consumer = Thread(target=_consume, daemon=True)
+    consumer.start()
+    consumer.join(timeout=10)
+
+    assert not consumer.is_alive()
+    assert seen == ["first\n"]
+    assert len(raised) == 1
+    assert isinstance(raised[0], SystemExit)
+
+
+def test_iterate_output_stops_reader():
+    """Stopping early should close the underlying output"""
+    closed = []
+
+    def _output():
+        try:
+            while True:
+                yield "line\n"
+        finally:
+            closed.append(True)
+
+    with closing(_iterate_output(_output())) as lines:
+        for _ in range(10):
+            next(lines)
+
+    for _ in range(50):
+        if closed:
+            break
+        time.sleep(0.1)
+
+    assert closed == [True]
+
+
+def test_bind_path(tmpdir):
+    """Relative paths become absolute, and links are resolved only when asked"""
+    target = Path(tmpdir) / "target"
+    target.mkdir()
+    link = Path(tmpdir) / "link"
+    link.symlink_to(target)
+
+    assert _bind_path(path=link) == str(link)
+    assert _bind_path(path=link, resolve=True) == str(target.resolve())
+    assert _bind_path(path=Path("example")) == str(Path("example").absolute())
+
+
+def test_bind_path_repointed_link(tmpdir):
+    """A re-pointed link should resolve to its new target"""
+    first = Path(tmpdir) / "first"
+    first.mkdir()
+    second = Path(tmpdir) / "second"
+    second.mkdir()
+    link = Path(tmpdir) / "link"
+    link.symlink_to(first)
+
+    assert _bind_path(path=link, resolve=True) == str(first.resolve())
+
+    link.unlink()
+    link.symlink_to(second)
+
+    assert _bind_path(path=link, resolve=True) == str(second.resolve())
+
+
+def test_run_singularity_command_missing_image(fake_container):
+    """A container removed after a successful run should be noticed"""
+    image, calls, _ = fake_container
+
+    run_singularity_command(image=image, command="echo example")
+    assert calls[-1]["image"] == image.resolve().as_posix()
+
+    image.unlink()
+    with pytest.raises(FileNotFoundError):
+        run_singularity_command(image=image, command="echo example")
+    assert len(calls) == 1
+
+
+def _output_records(caplog) -> list[str]:
+    return [
+        record.getMessage()
+        for record in caplog.records
+        if record.getMessage().startswith("output")
+    ]
+
+
+def test_run_singularity_command_batches_logging(fake_container, caplog):
+    """Output lines are logged in batches, with everything logged by the end
+    and the callback applied to every line"""
+    image, _, output = fake_container
+    output[:] = [f"output {i}\n" for i in range(3000)]
+
+    seen: list[str] = []
+    caplog.set_level(logging.INFO, logger="flint")
+    run_singularity_command(
+        image=image, command="echo example", stream_callback_func=seen.append
+    )
+
+    assert seen == output
+
+    records = _output_records(caplog)
+    assert 1 < len(records) < len(output)
+    assert "\n".join(records).split("\n") == [line.rstrip() for line in output]
+
+
+def test_run_singularity_command_ignore_logging(fake_container, caplog):
+    """The callback is still applied when output is not logged"""
+    image, _, output = fake_container
+    output[:] = [f"output {i}\n" for i in range(10)]
+
+    seen: list[str] = []
+    caplog.set_level(logging.INFO, logger="flint")
+    run_singularity_command(
+        image=image,
+        command="echo example",
+        stream_callback_func=seen.append,
+        ignore_logging_output=True,
+    )
+
+    assert seen == output
+    assert _output_records(caplog) == []
+
+
+def test_run_singularity_command_flushes_while_idle(
+    fake_container, caplog, monkeypatch
+):
+    """Buffered output is logged after a pause, without waiting for more lines"""
+    image, _, _ = fake_container
+    logged_before_next_line: list[bool] = []
+
+    def _execute(**kwargs):
+        yield "output first\n"
+        for _ in range(50):
+            if _output_records(caplog):
+                break
+            time.sleep(0.1)
+        logged_before_next_line.append(bool(_output_records(caplog)))
+        yield "output second\n"
+
+    monkeypatch.setattr(flint.sclient.sclient, "execute", _execute)
+
+    caplog.set_level(logging.INFO, logger="flint")
+    run_singularity_command(image=image, command="echo example")
+
+    assert logged_before_next_line == [True]
+    assert _output_records(caplog) == ["output first", "output second"]
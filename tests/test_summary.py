@@ -1,18 +1,22 @@
 from __future__ import annotations
 
 import shutil
+import typing
 from pathlib import Path
 
+import astropy.units as u
 import numpy as np
 import pytest
-from astropy.coordinates import EarthLocation, Latitude, Longitude
+from astropy.coordinates import AltAz, EarthLocation, Latitude, Longitude, SkyCoord
 from astropy.time import Time
 
 from flint.imager.wsclean import ImageSet
 from flint.ms import get_telescope_location_from_ms, get_times_from_ms
 from flint.source_finding.aegean import AegeanOutputs
 from flint.summary import (
+    BeamSummary,
     FieldSummary,
+    _transform_to_altaz,
     add_rms_information,
     create_beam_summary,
     create_field_summary,
@@ -243,3 +247,50 @@ def test_ms_example_telescope(ms_example):
     telescope = get_telescope_location_from_ms(ms=ms_example)
 
     assert isinstance(telescope, EarthLocation)
+
+
+def test_transform_to_altaz_repeated_times(ms_example):
+    """The AltAz transform over unique times should match the direct transform"""
+    telescope = get_telescope_location_from_ms(ms=ms_example)
+    times = get_times_from_ms(ms=ms_example)
+    centre = SkyCoord(98.211959 * u.deg, -30.86099889 * u.deg)
+
+    centre_altaz = _transform_to_altaz(
+        centre=centre, ms_times=times, location=telescope
+    )
+    expected_altaz = centre.transform_to(AltAz(obstime=times, location=telescope))
+
+    assert centre_altaz.shape == times.shape
+    assert np.allclose(centre_altaz.az.deg, expected_altaz.az.deg)
+    assert np.allclose(centre_altaz.alt.deg, expected_altaz.alt.deg)
+
+    # Repeat the times so that there are duplicates to collapse
+    repeated_times = Time(
+        np.repeat(times.mjd, 3), format="mjd", precision=6, location=telescope
+    )
+    centre_altaz = _transform_to_altaz(
+        centre=centre, ms_times=repeated_times, location=telescope
+    )
+    expected_altaz = centre.transform_to(
+        AltAz(obstime=repeated_times, location=telescope)
+    )
+
+    assert centre_altaz.shape == repeated_times.shape
+    assert np.allclose(centre_altaz.az.deg, expected_altaz.az.deg)
+    assert np.allclose(centre_altaz.alt.deg, expected_altaz.alt.deg)
+    assert centre_altaz.obstime.format == "mjd"
+    assert centre_altaz.obstime.precision == 6
+    assert centre_altaz.obstime.location == telescope
+
+
+def test_summary_type_hints_resolve():
+    """Type hints are inspected when functions are wrapped as prefect tasks"""
+    for item in (
+        BeamSummary,
+        FieldSummary,
+        create_beam_summary,
+        create_field_summary,
+        update_field_summary,
+        add_rms_information,
+    ):
+        typing.get_type_hints(item)
@@ -21,7 +21,9 @@ from flint.exceptions import TimeLimitException
 from flint.logging import logger
 from flint.utils import (
     SlurmInfo,
+    _estimate_image_centre,
     copy_directory,
+    estimate_image_centre,
     estimate_skycoord_centre,
     flatten_items,
     generate_strict_stub_wcs_header,
@@ -585,3 +587,35 @@ def test_estimate_skycoord_centre_wrap():
 
     assert np.isclose(mean_pos.ra.deg, 359.54349533)
     assert np.isclose(mean_pos.dec.deg, -40.51255648)
+
+
+def test_estimate_image_centre_cached(tmpdir):
+    """The centre should be re-estimated when the image is modified"""
+    rms_path = Path(
+        get_packaged_resource_path(
+            package="flint.data.tests",
+            filename="SB39400.RACS_0635-31.beam0-MFS-subimage_rms.fits",
+        )
+    )
+    image_path = Path(tmpdir) / rms_path.name
+    shutil.copy(rms_path, image_path)
+
+    centre = estimate_image_centre(image_path=image_path)
+    hits = _estimate_image_centre.cache_info().hits
+    cached_centre = estimate_image_centre(image_path=image_path)
+    assert _estimate_image_centre.cache_info().hits == hits + 1
+
+    # Each caller gets its own copy of the cached result
+    assert cached_centre is not centre
+    assert cached_centre is not _estimate_image_centre(
+        image_path=image_path, modified_time=image_path.stat().st_mtime
+    )
+    assert np.isclose(cached_centre.ra.deg, centre.ra.deg)
+
+    with fits.open(image_path, mode="update") as image:
+        image[0].header["CRVAL1"] += 1.0  # type: ignore
+    modified_time = image_path.stat().st_mtime + 10
+    os.utime(image_path, (modified_time, modified_time))
+
+    new_centre = estimate_image_centre(image_path=image_path)
+    assert not np.isclose(new_centre.ra.deg, centre.ra.deg)